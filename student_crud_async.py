@@ -0,0 +1,308 @@
+import asyncio
+import sys
+
+import asyncpg
+
+from student_crud import DB_CONFIG
+
+
+# ============================================
+# Connection Pool
+# ============================================
+
+# Created lazily by main() because asyncpg pools must be built inside a
+# running event loop.
+_pool = None
+
+
+async def get_pool():
+    """
+    Returns the shared asyncpg connection pool, creating it on first use.
+
+    Returns:
+        asyncpg.Pool: the shared connection pool
+    """
+    global _pool
+    if _pool is None:
+        # A generous statement cache means each query text is parsed and
+        # planned by the server only once per connection; later calls
+        # reuse the server-side prepared statement.
+        _pool = await asyncpg.create_pool(
+            min_size=2, max_size=10, statement_cache_size=512, **DB_CONFIG
+        )
+    return _pool
+
+
+# ============================================
+# SQL Statements
+# ============================================
+
+# Each query is a single module-level constant so every call passes the
+# exact same SQL text to asyncpg, guaranteeing a hit in its per-connection
+# LRU statement cache (no re-parse, no re-plan).
+_SQL_SELECT_ALL = (
+    "SELECT student_id, first_name, last_name, email, enrollment_date "
+    "FROM students ORDER BY student_id"
+)
+_SQL_INSERT = (
+    "INSERT INTO students (first_name, last_name, email, enrollment_date) "
+    "VALUES ($1, $2, $3, $4::date) RETURNING student_id"
+)
+_SQL_SELECT_ONE = (
+    "SELECT first_name, last_name, email FROM students WHERE student_id = $1"
+)
+_SQL_UPDATE_EMAIL = "UPDATE students SET email = $1 WHERE student_id = $2"
+_SQL_DELETE = (
+    "DELETE FROM students WHERE student_id = $1 "
+    "RETURNING first_name, last_name, email"
+)
+
+
+# ============================================
+# CRUD Operations
+# ============================================
+
+async def getAllStudents():
+    """
+    Retrieves and displays all records from the students table.
+
+    Uses asyncpg's binary protocol to fetch the whole table in one
+    round-trip without blocking the event loop.
+
+    Returns:
+        None
+    """
+    try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            students = await conn.fetch(_SQL_SELECT_ALL)
+
+        if students:
+            print("\n" + "="*80)
+            print("ALL STUDENTS")
+            print("="*80)
+            print(f"{'ID':<5} {'First Name':<15} {'Last Name':<15} {'Email':<30} {'Enrollment Date':<15}")
+            print("-"*80)
+
+            for student in students:
+                enrollment_date = student['enrollment_date']
+                enrollment_str = enrollment_date.strftime('%Y-%m-%d') if enrollment_date else 'N/A'
+                print(f"{student['student_id']:<5} {student['first_name']:<15} "
+                      f"{student['last_name']:<15} {student['email']:<30} {enrollment_str:<15}")
+
+            print("="*80)
+            print(f"Total students: {len(students)}\n")
+        else:
+            print("\nNo students found in the database.\n")
+
+    except asyncpg.PostgresError as e:
+        print(f"Error retrieving students: {e}")
+
+
+async def addStudent(first_name, last_name, email, enrollment_date):
+    """
+    Inserts a new student record into the students table.
+
+    Args:
+        first_name (str): Student's first name
+        last_name (str): Student's last name
+        email (str): Student's email address (must be unique)
+        enrollment_date (str): Enrollment date in 'YYYY-MM-DD' format
+
+    Returns:
+        bool: True if insertion successful, False otherwise
+    """
+    try:
+        # Validate inputs
+        if not all([first_name, last_name, email]):
+            print("Error: First name, last name, and email are required.")
+            return False
+
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                _SQL_INSERT, first_name, last_name, email, enrollment_date
+            )
+
+        print(f"\n✓ Student added successfully!")
+        print(f"  Student ID: {row['student_id']}")
+        print(f"  Name: {first_name} {last_name}")
+        print(f"  Email: {email}")
+        print(f"  Enrollment Date: {enrollment_date}\n")
+
+        return True
+
+    except asyncpg.UniqueViolationError:
+        # Handle unique constraint violation (duplicate email)
+        print(f"\n✗ Error: Email '{email}' already exists in the database.\n")
+        return False
+
+    except asyncpg.PostgresError as e:
+        print(f"\n✗ Error adding student: {e}\n")
+        return False
+
+
+async def updateStudentEmail(student_id, new_email):
+    """
+    Updates the email address for a student with the specified student_id.
+
+    Args:
+        student_id (int): The ID of the student to update
+        new_email (str): The new email address
+
+    Returns:
+        bool: True if update successful, False otherwise
+    """
+    try:
+        # Validate inputs
+        if not new_email:
+            print("Error: New email is required.")
+            return False
+
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            # Check if the student exists
+            student = await conn.fetchrow(_SQL_SELECT_ONE, student_id)
+
+            if not student:
+                print(f"\n✗ Error: No student found with ID {student_id}.\n")
+                return False
+
+            await conn.execute(_SQL_UPDATE_EMAIL, new_email, student_id)
+
+        print(f"\n✓ Email updated successfully!")
+        print(f"  Student ID: {student_id}")
+        print(f"  Name: {student['first_name']} {student['last_name']}")
+        print(f"  Old Email: {student['email']}")
+        print(f"  New Email: {new_email}\n")
+        return True
+
+    except asyncpg.UniqueViolationError:
+        # Handle unique constraint violation (duplicate email)
+        print(f"\n✗ Error: Email '{new_email}' already exists in the database.\n")
+        return False
+
+    except asyncpg.PostgresError as e:
+        print(f"\n✗ Error updating student email: {e}\n")
+        return False
+
+
+async def deleteStudent(student_id):
+    """
+    Deletes the record of the student with the specified student_id.
+
+    Args:
+        student_id (int): The ID of the student to delete
+
+    Returns:
+        bool: True if deletion successful, False otherwise
+    """
+    try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            student = await conn.fetchrow(_SQL_DELETE, student_id)
+
+        if not student:
+            print(f"\n✗ Error: No student found with ID {student_id}.\n")
+            return False
+
+        print(f"\n✓ Student deleted successfully!")
+        print(f"  Student ID: {student_id}")
+        print(f"  Name: {student['first_name']} {student['last_name']}")
+        print(f"  Email: {student['email']}\n")
+        return True
+
+    except asyncpg.PostgresError as e:
+        print(f"\n✗ Error deleting student: {e}\n")
+        return False
+
+
+# ============================================
+# Interactive Menu System
+# ============================================
+
+def display_menu():
+    """Displays the main menu options."""
+    print("\n" + "="*50)
+    print("STUDENT MANAGEMENT SYSTEM (async)")
+    print("="*50)
+    print("1. View all students")
+    print("2. Add a new student")
+    print("3. Update student email")
+    print("4. Delete a student")
+    print("5. Exit")
+    print("="*50)
+
+
+async def ainput(prompt):
+    """Reads a line from stdin without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, input, prompt)
+
+
+async def main():
+    """
+    Main coroutine that runs the interactive menu system.
+    Allows users to perform CRUD operations through a command-line interface.
+    """
+    print("\nWelcome to the Student Database Management System!")
+
+    while True:
+        display_menu()
+        choice = (await ainput("\nEnter your choice (1-5): ")).strip()
+
+        if choice == '1':
+            # View all students
+            await getAllStudents()
+
+        elif choice == '2':
+            # Add a new student
+            print("\n--- Add New Student ---")
+            first_name = (await ainput("Enter first name: ")).strip()
+            last_name = (await ainput("Enter last name: ")).strip()
+            email = (await ainput("Enter email: ")).strip()
+            enrollment_date = (await ainput("Enter enrollment date (YYYY-MM-DD): ")).strip()
+
+            await addStudent(first_name, last_name, email, enrollment_date)
+
+        elif choice == '3':
+            # Update student email
+            print("\n--- Update Student Email ---")
+            try:
+                student_id = int((await ainput("Enter student ID: ")).strip())
+                new_email = (await ainput("Enter new email: ")).strip()
+                await updateStudentEmail(student_id, new_email)
+            except ValueError:
+                print("\n✗ Error: Student ID must be a number.\n")
+
+        elif choice == '4':
+            # Delete a student
+            print("\n--- Delete Student ---")
+            try:
+                student_id = int((await ainput("Enter student ID to delete: ")).strip())
+                confirm = (await ainput(f"Are you sure you want to delete student {student_id}? (yes/no): ")).strip().lower()
+
+                if confirm == 'yes':
+                    await deleteStudent(student_id)
+                else:
+                    print("\nDeletion cancelled.\n")
+            except ValueError:
+                print("\n✗ Error: Student ID must be a number.\n")
+
+        elif choice == '5':
+            # Exit
+            print("\nThank you for using the Student Management System. Goodbye!\n")
+            if _pool is not None:
+                await _pool.close()
+            sys.exit(0)
+
+        else:
+            print("\n✗ Invalid choice. Please enter a number between 1 and 5.\n")
+
+
+# ============================================
+# Entry Point
+# ============================================
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,6 +7,11 @@ CREATE TABLE students (
     enrollment_date DATE
 );
 
+-- Covering index: student_id lookups that only need name/email are
+-- answered by an index-only scan (also created automatically on startup)
+CREATE INDEX IF NOT EXISTS ix_students_cover
+    ON students (student_id) INCLUDE (first_name, last_name, email);
+
 -- Insert initial data
 INSERT INTO students (first_name, last_name, email, enrollment_date) VALUES
 ('John', 'Doe', 'john.doe@example.com', '2023-09-01'),